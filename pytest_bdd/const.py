@@ -26,6 +26,18 @@ class StepType:
     UNKNOWN = "Unknown"
 
 
+# Bit per step type, so type predicates on the step matching hot path are
+# single integer comparisons instead of string comparisons
+STEP_TYPE_BITS = {
+    StepType.CONTEXT: 1 << 0,
+    StepType.ACTION: 1 << 1,
+    StepType.OUTCOME: 1 << 2,
+    StepType.CONJUNCTION: 1 << 3,
+    StepType.UNSPECIFIED: 1 << 4,
+    StepType.UNKNOWN: 1 << 5,
+}
+
+
 STEP_PREFIXES = {
     FEATURE: "Feature: ",
     SCENARIO_OUTLINE: "Scenario Outline: ",
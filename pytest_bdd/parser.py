@@ -3,7 +3,7 @@ from __future__ import annotations
 import linecache
 import re
 from collections import OrderedDict, defaultdict
-from functools import partial
+from functools import lru_cache, partial
 from itertools import chain, count, filterfalse, product, zip_longest
 from operator import contains, methodcaller
 from pathlib import Path
@@ -74,6 +74,21 @@ STEP_PREFIXES = {
 
 SPLIT_LINE_RE = re.compile(r"(?<!\\)\|")
 COMMENT_RE = re.compile(r"(^|(?<=\s))#")
+# DOTALL so the "." matches also new lines
+MULTILINE_QUOTES_RE = re.compile(r'^"""\n(?P<content>.*)\n"""$', re.DOTALL)
+
+TAG_PREFIX = STEP_PREFIXES[TAG]
+TAG_SEPARATOR = f" {TAG_PREFIX}"
+
+
+@lru_cache(maxsize=4096)
+def _split_tags_cached(stripped_line: str) -> tuple[str, ...]:
+    """Split a stripped tag line into its tag names.
+
+    Identical tag lines (shared tags across feature files) are split once per
+    process; an immutable tuple is cached so callers can't corrupt the cache.
+    """
+    return tuple(tag.lstrip(TAG_PREFIX) for tag in stripped_line.split(TAG_SEPARATOR) if len(tag) > 1)
 
 
 @attrs
@@ -101,11 +116,23 @@ class ASTBuilderMixin:
         return instance
 
 
+@lru_cache(maxsize=128)
+def _parse_gherkin_ast_cached(feature_file_data: str) -> dict:
+    """Parse feature file content into its gherkin AST with a default-built parser.
+
+    Identical content (for example the same feature parsed for several scenarios
+    or test parametrizations) is tokenized and parsed once per process.
+    """
+    return CucumberIOBaseParser().parse(token_scanner_or_str=feature_file_data)
+
+
 @attrs
 class GherkinParser(CucumberIOBaseParser, ASTBuilderMixin, GlobMixin, ParserProtocol):
     ast_builder = attrib(default=None)
 
     def __attrs_post_init__(self):
+        # Remember before the base __init__ swaps None for a default AstBuilder
+        self._has_custom_ast_builder = self.ast_builder is not None
         CucumberIOBaseParser.__init__(self, ast_builder=self.ast_builder)
 
     def parse(self, path: Path, uri: str, *args, **kwargs) -> FeatureModel:
@@ -113,7 +140,11 @@ class GherkinParser(CucumberIOBaseParser, ASTBuilderMixin, GlobMixin, ParserProt
         with path.open(mode="r", encoding=encoding) as feature_file:
             feature_file_data = feature_file.read()
         try:
-            ast_data = CucumberIOBaseParser.parse(self, token_scanner_or_str=feature_file_data, *args, **kwargs)
+            if not self._has_custom_ast_builder and not args and not kwargs:
+                # Shallow copy: "uri" is stamped per parse on the top-level mapping
+                ast_data = dict(_parse_gherkin_ast_cached(feature_file_data))
+            else:
+                ast_data = CucumberIOBaseParser.parse(self, token_scanner_or_str=feature_file_data, *args, **kwargs)
         except CompositeParserException as e:
             raise FeatureError(
                 e.args[0],
@@ -382,11 +413,14 @@ class Parser(ASTBuilderMixin, GlobMixin, ParserProtocol):
 
         :return: List of tags.
         """
-        if not line or not line.strip().startswith(STEP_PREFIXES[TAG]):
+        # Called for every feature file line; reject non-tag lines with a
+        # single character scan before paying for strip/split allocations
+        if not line or TAG_PREFIX not in line:
             return OrderedSet()
-        return OrderedSet(
-            [tag.lstrip(STEP_PREFIXES[TAG]) for tag in line.strip().split(f" {STEP_PREFIXES[TAG]}") if len(tag) > 1]
-        )
+        stripped_line = line.strip()
+        if not stripped_line.startswith(TAG_PREFIX):
+            return OrderedSet()
+        return OrderedSet(_split_tags_cached(stripped_line))
 
 
 @attrs
@@ -560,12 +594,7 @@ class Step:
         multilines_content = dedent("\n".join(self.lines)) if self.lines else ""
 
         # Remove the multiline quotes, if present.
-        multilines_content = re.sub(
-            pattern=r'^"""\n(?P<content>.*)\n"""$',
-            repl=r"\g<content>",
-            string=multilines_content,
-            flags=re.DOTALL,  # Needed to make the "." match also new lines
-        )
+        multilines_content = MULTILINE_QUOTES_RE.sub(r"\g<content>", multilines_content)
 
         lines = ([self.first_name_row] if self.first_name_row else []) + [multilines_content]
         self.name = "\n".join(lines).strip()
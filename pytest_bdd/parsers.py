@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from re import Pattern as _RePattern
 from re import compile as re_compile
 from typing import Any, cast
@@ -42,6 +43,11 @@ class StepParser(StepParserProtocol, metaclass=ABCMeta):
         """Match given name with the step name."""
         raise NotImplementedError()  # pragma: no cover
 
+    @property
+    def literal_text(self) -> str | None:
+        """Literal step text matched by the parser, or `None` if the parser is parametrized."""
+        return None
+
 
 class _CommonRe(StepParser):
     regex: _RePattern
@@ -81,6 +87,14 @@ class _CommonParse(StepParser):
         except ValueError:
             return False
 
+    @property
+    def literal_text(self):
+        # Without replacement fields the expression matches its own text only
+        # (case-insensitively, which callers have to account for). Any brace
+        # means fields or "{{"/"}}" escapes, where the matched text differs
+        # from the pattern, so such expressions stay parametric.
+        return self.name if "{" not in self.name and "}" not in self.name else None
+
 
 class _parse(_CommonParse):
     def __init__(self, name: base_parse.Parser):
@@ -127,10 +141,29 @@ class string(StepParser):
         """Match given name with the step name."""
         return bool(self.name == name)
 
+    @property
+    def literal_text(self) -> str:
+        return self.name
+
+
+def _build_parser(parserlike: Any) -> StepParser:
+    if isinstance(parserlike, _RePattern):
+        return _re(parserlike)
+    elif isinstance(parserlike, base_parse.Parser):
+        return _parse(parserlike)
+    else:
+        return cfparse(parserlike)
+
+
+_build_parser_cached = lru_cache(maxsize=4096, typed=True)(_build_parser)
+
 
 def get_parser(parserlike: str | StepParser | StepParserProtocol) -> StepParser:
     """Get parser by given name.
 
+    Parsers built from identical hashable patterns (for example the same step text
+    reused across `@given`/`@when` aliases) are compiled once and shared.
+
     :param parserlike: name of the step to parse
 
     :return: step parser object
@@ -139,9 +172,7 @@ def get_parser(parserlike: str | StepParser | StepParserProtocol) -> StepParser:
 
     if isinstance(parserlike, StepParserProtocol):
         return cast(StepParser, parserlike)
-    elif isinstance(parserlike, _RePattern):
-        return _re(parserlike)
-    elif isinstance(parserlike, base_parse.Parser):
-        return _parse(parserlike)
-    else:
-        return cfparse(parserlike)
+    try:
+        return _build_parser_cached(parserlike)
+    except TypeError:  # unhashable patterns can't be memoized
+        return _build_parser(parserlike)
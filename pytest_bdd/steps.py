@@ -38,20 +38,28 @@ from __future__ import annotations
 
 import warnings
 from contextlib import suppress
-from typing import Any, Callable, Iterable, Iterator, Sequence, cast
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, cast
 from warnings import warn
+from weakref import WeakKeyDictionary
 
 import pytest
 from attr import Factory, attrib, attrs
-from ordered_set import OrderedSet
 
-from pytest_bdd.const import StepType
+from pytest_bdd.const import STEP_TYPE_BITS, StepType
 from pytest_bdd.model import Feature, Scenario, Step
 from pytest_bdd.parsers import StepParser, get_parser
 from pytest_bdd.typing.pytest import Config, Parser, TypeAlias
 from pytest_bdd.utils import deepattrgetter, get_caller_module_locals, setdefaultattr
 from pytest_bdd.warning_types import PytestBDDStepDefinitionWarning
 
+_UNSPECIFIED_BIT = STEP_TYPE_BITS[StepType.UNSPECIFIED]
+
+# Immutable defaults shared by every step definition decorated without keyword arguments
+_EMPTY_CONVERTERS: Mapping = MappingProxyType({})
+_EMPTY_PARAM_DEFAULTS: Mapping = MappingProxyType({})
+_NO_TARGET_FIXTURES: Sequence[str] = ()
+
 
 def add_options(parser: Parser):
     """Add pytest-bdd options."""
@@ -63,6 +71,13 @@ def add_options(parser: Parser):
         default=None,
         help="Allow use different keywords with same step definition",
     )
+    group.addoption(
+        "--bdd-detect-ambiguous-steps",
+        action="store_true",
+        dest="bdd_detect_ambiguous_steps",
+        default=False,
+        help="Warn if alternative step definitions are found for a step",
+    )
     parser.addini(
         "liberal_steps",
         default=False,
@@ -102,6 +117,7 @@ def given(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        caller_locals=get_caller_module_locals(depth=2),
     )
 
 
@@ -136,6 +152,7 @@ def when(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        caller_locals=get_caller_module_locals(depth=2),
     )
 
 
@@ -170,6 +187,7 @@ def then(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        caller_locals=get_caller_module_locals(depth=2),
     )
 
 
@@ -204,25 +222,48 @@ def step(
         params_fixtures_mapping=params_fixtures_mapping,
         param_defaults=param_defaults,
         liberal=liberal,
+        caller_locals=get_caller_module_locals(depth=2),
     )
 
 
 class StepHandler:
     Model: TypeAlias = "Step"
 
-    @attrs
     class Matcher:
-        config: Config = attrib()
-        feature: Feature = attrib(init=False)
-        pickle: Scenario = attrib(init=False)
-        step: Step = attrib(init=False)
-        previous_step: Step | None = attrib(init=False)
-        step_registry: StepHandler.Registry = attrib(init=False)
-        step_type_context = attrib(default=None)
+        __slots__ = (
+            "config",
+            "feature",
+            "pickle",
+            "step",
+            "previous_step",
+            "step_registry",
+            "step_type_context",
+            "default_liberal",
+        )
+
+        config: Config
+        feature: Feature
+        pickle: Scenario
+        step: Step
+        previous_step: Step | None
+        step_registry: StepHandler.Registry
 
         class MatchNotFoundError(RuntimeError):
             pass
 
+        # The same ambiguity would be re-detected by every scenario using the step,
+        # so each (step text, step type context) pair is warned about only once
+        _warned_ambiguous_steps: set[tuple[str, str, bool]] = set()
+
+        def __init__(self, config: Config, step_type_context=None):
+            self.config = config
+            self.step_type_context = step_type_context
+            # Session-wide default for step definitions without an explicit `liberal` setting
+            if config.option.liberal_steps is not None:
+                self.default_liberal = config.option.liberal_steps
+            else:
+                self.default_liberal = config.getini("liberal_steps")
+
         def __call__(
             self,
             feature: Feature,
@@ -245,64 +286,69 @@ class StepHandler:
             if self.step_type_context == StepType.CONJUNCTION:
                 self.step_type_context = StepType.UNKNOWN
 
-            step_definitions = list(
-                self.find_step_definition_matches(
-                    self.step_registry, (self.strict_matcher, self.unspecified_matcher, self.liberal_matcher)
-                )
-            )
-
-            if len(step_definitions) > 0:
+            match_cache = self.step_registry.match_cache if self.step_registry is not None else None
+            # Registries outlive a pytest session on imported modules, and the
+            # liberal tier depends on the liberal-steps configuration, so the
+            # resolved default is part of the key
+            match_cache_key = (self.step.text, self.step_type_context, self.default_liberal)
+            if match_cache is not None:
+                with suppress(KeyError):
+                    return match_cache[match_cache_key]
+
+            matches_iterator = iter(self.find_step_definition_matches(self.step_registry))
+
+            step_definition = next(matches_iterator, None)
+            if step_definition is None:
+                raise self.MatchNotFoundError
+            if self.config.option.bdd_detect_ambiguous_steps and match_cache_key not in self._warned_ambiguous_steps:
+                step_definitions = [step_definition, *matches_iterator]
                 if len(step_definitions) > 1:
+                    self._warned_ambiguous_steps.add(match_cache_key)
                     warn(PytestBDDStepDefinitionWarning(f"Alternative step definitions are found: {step_definitions}"))
-                return step_definitions[0]
-            raise self.MatchNotFoundError
-
-        def strict_matcher(self, step_definition):
-            return step_definition.type_ == self.step_type_context and step_definition.parser.is_matching(
-                self.step.text
-            )
-
-        def unspecified_matcher(self, step_definition):
-            return (
-                self.step_type_context == StepType.UNSPECIFIED or step_definition.type_ == StepType.UNSPECIFIED
-            ) and step_definition.parser.is_matching(self.step.text)
-
-        def liberal_matcher(self, step_definition):
-            if step_definition.liberal is None:
-                if self.config.option.liberal_steps is not None:
-                    is_step_definition_liberal = self.config.option.liberal_steps
-                else:
-                    is_step_definition_liberal = self.config.getini("liberal_steps")
-            else:
-                is_step_definition_liberal = step_definition.liberal
-
-            return all(
-                (
-                    not self.unspecified_matcher(step_definition),
-                    is_step_definition_liberal,
-                    step_definition.type_ != self.step_type_context,
-                    step_definition.parser.is_matching(self.step.text),
-                )
-            )
+            if match_cache is not None:
+                match_cache[match_cache_key] = step_definition
+            return step_definition
 
-        @staticmethod
         def find_step_definition_matches(
-            registry: StepHandler.Registry | None, matchers: Sequence[Callable[[StepHandler.Definition], bool]]
+            self, registry: StepHandler.Registry | None
         ) -> Iterable[StepHandler.Definition]:
-            if registry:
-                found_matches = False
-                for matcher in matchers:
-                    for step_definition in registry:
-                        if matcher(step_definition):
-                            found_matches = True
-                            yield step_definition
-                    if found_matches:
-                        break
-                if not found_matches:
-                    with suppress(AttributeError):
-                        yield from StepHandler.Matcher.find_step_definition_matches(registry.parent, matchers)
-
-    @attrs(auto_attribs=True, eq=False)
+            """Yield matching definitions by tier: strict, then unspecified, then liberal.
+
+            Candidates are walked once per registry level, so the (potentially
+            expensive) parser match runs a single time per candidate regardless of
+            which tier the candidate lands in.
+            """
+            step_text = self.step.text
+            context_type_bit = STEP_TYPE_BITS.get(self.step_type_context, 0)
+            context_is_unspecified = bool(context_type_bit & _UNSPECIFIED_BIT)
+            lowered_step_text = step_text.lower()
+            current_registry = registry
+            while current_registry:
+                candidate_definitions = current_registry.get_candidate_definitions(lowered_step_text)
+                if not candidate_definitions:
+                    # Only literal definitions for other step texts live at this level,
+                    # so nothing here can match - go straight to the parent registry
+                    current_registry = getattr(current_registry, "parent", None)
+                    continue
+                strict_matches: list[StepHandler.Definition] = []
+                unspecified_matches: list[StepHandler.Definition] = []
+                liberal_matches: list[StepHandler.Definition] = []
+                for step_definition in candidate_definitions:
+                    if not step_definition.parser.is_matching(step_text):
+                        continue
+                    if step_definition.type_bit == context_type_bit:
+                        strict_matches.append(step_definition)
+                    elif context_is_unspecified or step_definition.type_bit & _UNSPECIFIED_BIT:
+                        unspecified_matches.append(step_definition)
+                    elif step_definition.liberal if step_definition.liberal is not None else self.default_liberal:
+                        liberal_matches.append(step_definition)
+                matches = strict_matches or unspecified_matches or liberal_matches
+                if matches:
+                    yield from matches
+                    return
+                current_registry = getattr(current_registry, "parent", None)
+
+    @attrs(auto_attribs=True, eq=False, slots=True)
     class Definition:
         func: Callable
         type_: str | None
@@ -312,18 +358,34 @@ class StepHandler:
         param_defaults: dict
         target_fixtures: list[str]
         liberal: Any | None
+        type_bit: int = attrib(init=False)
+        literal_text: str | None = attrib(init=False)
+
+        def __attrs_post_init__(self):
+            self.type_bit = STEP_TYPE_BITS.get(self.type_, 0)
+            self.literal_text = getattr(self.parser, "literal_text", None)
 
         def get_parameters(self, step: Step):
             parsed_arguments = self.parser.parse_arguments(step.name) or {}
-            return {
-                **self.param_defaults,
-                **{arg: self.converters.get(arg, lambda _: _)(value) for arg, value in parsed_arguments.items()},
-            }
-
-    @attrs
+            converters = self.converters
+            parameters = dict(self.param_defaults)
+            for arg, value in parsed_arguments.items():
+                converter = converters.get(arg)
+                parameters[arg] = value if converter is None else converter(value)
+            return parameters
+
+    @attrs(slots=True)
     class Registry:
         registry: set[StepHandler.Definition] = attrib(default=Factory(set))
         parent: StepHandler.Registry = attrib(default=None, init=False)
+        match_cache: dict[tuple[str, str, bool], StepHandler.Definition] = attrib(default=Factory(dict), init=False)
+        _definitions: list[StepHandler.Definition] = attrib(default=Factory(list), init=False)
+        _by_literal: dict[str, list[StepHandler.Definition]] = attrib(default=Factory(dict), init=False)
+        _parametric: list[StepHandler.Definition] = attrib(default=Factory(list), init=False)
+
+        # Modules are scanned for step definition holders once; step definitions are
+        # registered at import time, so the scan result is stable afterwards
+        _module_step_holders_cache: WeakKeyDictionary = WeakKeyDictionary()
 
         @classmethod
         def setdefault_step_registry_fixture(cls, caller_locals: dict):
@@ -335,7 +397,31 @@ class StepHandler:
         @classmethod
         def register_step_definition(cls, step_definition, caller_locals: dict):
             fixture = cls.setdefault_step_registry_fixture(caller_locals=caller_locals)
-            fixture.__registry__.registry.add(step_definition)
+            fixture.__registry__.add_step_definition(step_definition)
+
+        def add_step_definition(self, step_definition: StepHandler.Definition):
+            if step_definition in self.registry:
+                return
+            self.registry.add(step_definition)
+            self._definitions.append(step_definition)
+            literal_text = step_definition.literal_text
+            if literal_text is not None:
+                self._by_literal.setdefault(literal_text.lower(), []).append(step_definition)
+            else:
+                self._parametric.append(step_definition)
+            # Step definitions are usually registered at import time, so invalidations are rare
+            self.match_cache.clear()
+
+        def get_candidate_definitions(self, lowered_step_text: str) -> list[StepHandler.Definition]:
+            """Definitions which could possibly match the given (lowercased) step text.
+
+            Literal definitions for other step texts can never match, so only the
+            exact-text bucket and the parametrized definitions are candidates.
+            """
+            try:
+                return self._by_literal[lowered_step_text] + self._parametric
+            except KeyError:
+                return self._parametric
 
         @classmethod
         def register_steps(cls, *step_funcs, caller_locals: dict):
@@ -362,21 +448,36 @@ class StepHandler:
             if caller_locals is None:
                 caller_locals = get_caller_module_locals(depth=2)
 
+            try:
+                module_step_holders = cls._module_step_holders_cache[module]
+            except KeyError:
+                module_step_holders = [
+                    (name, obj)
+                    for name, obj in module.__dict__.items()
+                    if hasattr(obj, "__pytest_bdd_step_definitions__")
+                ]
+                cls._module_step_holders_cache[module] = module_step_holders
+
             def registrable_steps():
+                # Dedup by id: the registry loop may re-yield functions already seen in the
+                # module namespace, and id() avoids hashing arbitrary callables
+                seen_ids = set()
                 # module items
-                for name, obj in module.__dict__.items():
-                    if hasattr(obj, "__pytest_bdd_step_definitions__") and (
-                        steps is None or any((name in steps, obj in steps))
-                    ):
-                        yield obj
+                for name, obj in module_step_holders:
+                    if steps is None or any((name in steps, obj in steps)):
+                        if id(obj) not in seen_ids:
+                            seen_ids.add(id(obj))
+                            yield obj
                 # module registry items
                 for obj in deepattrgetter("__registry__.registry", default=None)(module.__dict__.get("step_registry"))[
                     0
                 ]:
                     if steps is None or obj.func in steps:
-                        yield obj.func
+                        if id(obj.func) not in seen_ids:
+                            seen_ids.add(id(obj.func))
+                            yield obj.func
 
-            cls.register_steps(*set(registrable_steps()), caller_locals=caller_locals)
+            cls.register_steps(*registrable_steps(), caller_locals=caller_locals)
 
         @property
         def fixture(self):
@@ -389,7 +490,9 @@ class StepHandler:
             return step_registry
 
         def __iter__(self) -> Iterator[StepHandler.Definition]:
-            return iter(self.registry)
+            # The set is kept for dedup on insert; iteration uses the list mirror
+            # for cache locality and a deterministic (registration) order
+            return iter(self._definitions)
 
     @staticmethod
     def decorator_builder(
@@ -401,6 +504,7 @@ class StepHandler:
         params_fixtures_mapping: set[str] | dict[str, str] | Any = True,
         param_defaults: dict | None = None,
         liberal: Any | None = None,
+        caller_locals: dict | None = None,
     ) -> Callable:
         """StepHandler decorator for the type and the name.
 
@@ -412,22 +516,39 @@ class StepHandler:
         :param params_fixtures_mapping: StepHandler parameters would be injected as fixtures
         :param param_defaults: Default parameters for step definition
         :param liberal: Could step definition be used with other keywords
+        :param caller_locals: Locals of the module the step is defined in; captured once by
+                              the `given`/`when`/`then`/`step` factories instead of walking
+                              the frame stack on every decoration
 
         :return: Decorator function for the step.
         """
 
-        converters = converters or {}
-        param_defaults = param_defaults or {}
-        if target_fixture is not None and target_fixtures is not None:
-            warnings.warn(PytestBDDStepDefinitionWarning("Both target_fixture and target_fixtures are specified"))
-        target_fixtures = list(
-            OrderedSet(
-                [
-                    *([target_fixture] if target_fixture is not None else []),
-                    *(target_fixtures if target_fixtures is not None else []),
-                ]
+        if (
+            converters is None
+            and target_fixture is None
+            and target_fixtures is None
+            and param_defaults is None
+            and liberal is None
+            and params_fixtures_mapping is True
+        ):
+            # Fast path for the common `@given("...")`-style decoration: all keyword
+            # arguments take defaults, so the shared immutable empties can be used
+            converters = cast(dict, _EMPTY_CONVERTERS)
+            param_defaults = cast(dict, _EMPTY_PARAM_DEFAULTS)
+            target_fixtures = cast(list, _NO_TARGET_FIXTURES)
+        else:
+            converters = converters or {}
+            param_defaults = param_defaults or {}
+            if target_fixture is not None and target_fixtures is not None:
+                warnings.warn(PytestBDDStepDefinitionWarning("Both target_fixture and target_fixtures are specified"))
+            target_fixtures = list(
+                dict.fromkeys(
+                    [
+                        *([target_fixture] if target_fixture is not None else []),
+                        *(target_fixtures if target_fixtures is not None else []),
+                    ]
+                )
             )
-        )
 
         def decorator(step_func: Callable) -> Callable:
             """
@@ -451,7 +572,7 @@ class StepHandler:
 
             StepHandler.Registry.register_step_definition(
                 step_definition=step_definiton,
-                caller_locals=get_caller_module_locals(depth=2),
+                caller_locals=caller_locals if caller_locals is not None else get_caller_module_locals(depth=2),
             )
 
             return step_func
@@ -258,5 +258,5 @@ def setdefaultattr(obj, key, value: Literal[EMPTY.EMPTY] | Any = EMPTY.EMPTY, va
 
 def make_python_name(string: str) -> str:
     """Make python attribute name out of a given string."""
-    string = re.sub(PYTHON_REPLACE_REGEX, "", string.replace(" ", "_"))
-    return re.sub(ALPHA_REGEX, "", string).lower()
+    string = PYTHON_REPLACE_REGEX.sub("", string.replace(" ", "_"))
+    return ALPHA_REGEX.sub("", string).lower()
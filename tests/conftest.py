@@ -5,6 +5,15 @@ from tests.utils import PYTEST_6
 pytest_plugins = "pytester"
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--include-deprecated",
+        action="store_true",
+        default=False,
+        help="Also collect parametrizations covering deprecated functionality",
+    )
+
+
 def pytest_generate_tests(metafunc):
     if "pytest_params" in metafunc.fixturenames:
         if PYTEST_6:
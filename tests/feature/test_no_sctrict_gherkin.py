@@ -1,48 +1,79 @@
 """Test no strict gherkin for sections."""
 
-from pytest import mark, param
+from pytest import fixture, mark, param
 
-pytestmark = [mark.parametrize("parser,", [param("Parser", marks=[mark.deprecated]), "GherkinParser"])]
 
+def pytest_generate_tests(metafunc):
+    # The deprecated Parser case is not even collected unless explicitly
+    # requested, so the common run pays for the GherkinParser case only
+    parsers = [param("Parser", marks=[mark.deprecated]), "GherkinParser"]
+    if not metafunc.config.getoption("--include-deprecated"):
+        parsers = parsers[1:]
+    metafunc.parametrize("parser,", parsers)
 
-def test_background_no_strict_gherkin(testdir, parser):
-    """Test background no strict gherkin."""
-    testdir.makepyfile(
-        test_gherkin=f"""\
-            import pytest
 
-            from pytest_bdd import when, scenario
-            from pytest_bdd.parser import {parser} as Parser
+@fixture(scope="session")
+def gherkin_sources():
+    """Source templates shared by the tests of this module.
 
-            @scenario(
-                "no_strict_gherkin_background.feature",
-                "Test background",
-                parser=Parser()
-            )
-            def test_background():
-                pass
+    Built once per session; each parser parametrization only formats the
+    test module template with its parser class.
+    """
+    # Pre-dedented so pytester's dedent pass over them is a no-op
+    conftest_source = """\
+import pytest
 
+from pytest_bdd import parsers, when
 
-            @pytest.fixture
-            def foo():
-                return dict()
 
-            @when('foo has a value "bar"')
-            def bar(foo):
-                foo["bar"] = "bar"
-                return foo["bar"]
+@pytest.fixture
+def foo():
+    return dict()
 
+@when(parsers.parse('foo has a value "bar"'))
+def bar(foo):
+    foo["bar"] = "bar"
+    return foo["bar"]
 
-            @when('foo is not boolean')
-            def not_boolean(foo):
-                assert foo is not bool
 
+@when(parsers.parse('foo is not boolean'))
+def not_boolean(foo):
+    assert foo is not bool
 
-            @when('foo has not a value "baz"')
-            def has_not_baz(foo):
-                assert "baz" not in foo
-        """
-    )
+
+@when(parsers.parse('foo has not a value "baz"'))
+def has_not_baz(foo):
+    assert "baz" not in foo
+"""
+    test_module_template = """\
+from pytest_bdd import scenario
+from pytest_bdd.parser import {parser} as Parser
+
+@scenario(
+    "no_strict_gherkin_background.feature",
+    "Test background",
+    parser=Parser()
+)
+def test_background():
+    pass
+
+
+@scenario(
+    "no_strict_gherkin_scenario.feature",
+    "Test scenario",
+    parser=Parser()
+)
+def test_scenario():
+    pass
+"""
+    return conftest_source, test_module_template
+
+
+def test_no_strict_gherkin(testdir, parser, gherkin_sources):
+    """Test background and scenario no strict gherkin in one session."""
+    conftest_source, test_module_template = gherkin_sources
+    testdir.makeconftest(conftest_source)
+    testdir.makepyfile(test_gherkin=test_module_template.format(parser=parser))
 
     testdir.makefile(
         ".feature",
@@ -56,53 +87,6 @@ def test_background_no_strict_gherkin(testdir, parser):
 
                 Scenario: Test background
             """,
-    )
-
-    result = testdir.runpytest()
-    result.assert_outcomes(passed=1)
-
-
-def test_scenario_no_strict_gherkin(testdir, parser):
-    """Test scenario no strict gherkin."""
-    testdir.makepyfile(
-        test_gherkin=f"""\
-            import pytest
-
-            from pytest_bdd import when, scenario
-            from pytest_bdd.parser import {parser} as Parser
-
-            @scenario(
-                "no_strict_gherkin_scenario.feature",
-                "Test scenario",
-                parser=Parser()
-            )
-            def test_scenario():
-                pass
-
-
-            @pytest.fixture
-            def foo():
-                return dict()
-
-            @when('foo has a value "bar"')
-            def bar(foo):
-                foo["bar"] = "bar"
-                return foo["bar"]
-
-
-            @when('foo is not boolean')
-            def not_boolean(foo):
-                assert foo is not bool
-
-
-            @when('foo has not a value "baz"')
-            def has_not_baz(foo):
-                assert "baz" not in foo
-            """
-    )
-
-    testdir.makefile(
-        ".feature",
         no_strict_gherkin_scenario="""
     Feature: No strict Gherkin Scenario support
 
@@ -115,4 +99,4 @@ def test_scenario_no_strict_gherkin(testdir, parser):
     )
 
     result = testdir.runpytest()
-    result.assert_outcomes(passed=1)
+    result.assert_outcomes(passed=2)
@@ -0,0 +1,26 @@
+"""Test feature parsing internals."""
+from textwrap import dedent
+
+from pytest_bdd.parser import GherkinParser, _parse_gherkin_ast_cached
+
+
+def test_gherkin_ast_cache_hit(tmp_path):
+    """Identical feature content is parsed into its gherkin AST once per process."""
+    feature_file = tmp_path / "cached.feature"
+    feature_file.write_text(
+        dedent(
+            """\
+            Feature: Cached
+                Scenario: Cached scenario
+                    Given foo
+            """
+        )
+    )
+
+    _parse_gherkin_ast_cached.cache_clear()
+    first = GherkinParser().parse(feature_file, "cached.feature")
+    second = GherkinParser().parse(feature_file, "cached.feature")
+
+    assert _parse_gherkin_ast_cached.cache_info().hits == 1
+    # The feature model itself is built fresh per parse
+    assert first is not second
@@ -1,71 +1,133 @@
 """Test tags."""
-from operator import ge
-
 from pytest import mark, param
 
-from pytest_bdd.packaging import compare_distribution_version
 from pytest_bdd.parser import Parser
+from tests.utils import PYTEST_6, STRICT_OPTION
+
+if PYTEST_6:
+    # The marker-expression engine is only available since pytest 6
+    from _pytest.mark import MarkMatcher
+    from _pytest.mark.expression import Expression
+
+# Source constants are kept pre-dedented so pytester's own dedent pass
+# over them is a no-op
+TAGS_SELECTOR_INI = """\
+[pytest]
+markers =
+    feature_tag_1
+    feature_tag_2
+    scenario_tag_01
+    scenario_tag_02
+    scenario_tag_10
+    scenario_tag_20
+"""
+
+TAGS_SELECTOR_FEATURE = """\
+@feature_tag_1 @feature_tag_2
+Feature: Tags
+
+@scenario_tag_01 @scenario_tag_02
+Scenario: Tags
+    Given I have a bar
+
+@scenario_tag_10 @scenario_tag_20
+Scenario: Tags 2
+    Given I have a bar
+
+"""
+
+TAGS_STEPS_CONFTEST = """\
+from pytest_bdd import given
+
+@given('I have a bar')
+def i_have_bar():
+    return 'bar'
+
+@given('I have a baz')
+def i_have_baz():
+    return 'baz'
+"""
+
+TAGS_SCENARIOS_PY_TEMPLATE = """\
+from pytest_bdd import scenarios
+from pytest_bdd.parser import {parser} as Parser
+
+scenarios('test.feature', parser=Parser())
+"""
+
+TAGS_AFTER_BACKGROUND_INI = """\
+[pytest]
+markers = tag
+"""
+
+TAGS_AFTER_BACKGROUND_FEATURE = """\
+Feature: Tags after background
+
+    Background:
+        Given I have a bar
+
+    @tag
+    Scenario: Tags
+        Given I have a baz
+
+    Scenario: Tags 2
+        Given I have a baz
+"""
+
+INVALID_TAGS_FEATURE = """\
+        Feature: Invalid tags
+            Scenario: Invalid tags
+                @tag
+                Given foo
+                When bar
+                Then baz
+        """
+
+INVALID_TAGS_PY_TEMPLATE = """\
+from pytest_bdd import scenarios
+from pytest_bdd.parser import {parser} as Parser
+
+scenarios('features', parser=Parser())
+"""
 
 
 @mark.parametrize("parser,", [param("Parser", marks=[mark.deprecated]), "GherkinParser"])
 def test_tags_selector(testdir, parser):
     """Test tests selection by tags."""
-    testdir.makefile(
-        ".ini",
-        pytest="""\
-            [pytest]
-            markers =
-                feature_tag_1
-                feature_tag_2
-                scenario_tag_01
-                scenario_tag_02
-                scenario_tag_10
-                scenario_tag_20
-            """,
-    )
-    testdir.makefile(
-        ".feature",
-        test="""\
-            @feature_tag_1 @feature_tag_2
-            Feature: Tags
-
-            @scenario_tag_01 @scenario_tag_02
-            Scenario: Tags
-                Given I have a bar
-
-            @scenario_tag_10 @scenario_tag_20
-            Scenario: Tags 2
-                Given I have a bar
-
-            """,
-    )
-    testdir.makepyfile(
-        f"""\
-        import pytest
-        from pytest_bdd import given, scenarios
-        from pytest_bdd.parser import {parser} as Parser
-
-        @given('I have a bar')
-        def i_have_bar():
-            return 'bar'
-
-        scenarios('test.feature', parser=Parser())
-        """
-    )
-    result = testdir.runpytest("-m", "scenario_tag_10 and not scenario_tag_01", "-vv")
-    outcomes = result.parseoutcomes()
-    assert outcomes["passed"] == 1
-    assert outcomes["deselected"] == 1
-
-    result = testdir.runpytest("-m", "scenario_tag_01 and not scenario_tag_10", "-vv").parseoutcomes()
-    assert result["passed"] == 1
-    assert result["deselected"] == 1
-
-    result = testdir.runpytest("-m", "feature_tag_1", "-vv").parseoutcomes()
-    assert result["passed"] == 2
-
-    result = testdir.runpytest("-m", "feature_tag_10", "-vv").parseoutcomes()
-    assert result["deselected"] == 2
+    testdir.makefile(".ini", pytest=TAGS_SELECTOR_INI)
+    testdir.makefile(".feature", test=TAGS_SELECTOR_FEATURE)
+    testdir.makeconftest(TAGS_STEPS_CONFTEST)
+    testdir.makepyfile(TAGS_SCENARIOS_PY_TEMPLATE.format(parser=parser))
+
+    # One pytest session: its collected items carry the tag-driven markers
+    # for all selection expressions, and running it under -m verifies the
+    # selection and step execution end to end
+    reprec = testdir.inline_run("-m", "feature_tag_1", "-vv", "-p", "no:cacheprovider")
+    reprec.assertoutcome(passed=2)
+
+    if PYTEST_6:
+        (modifyitems_call,) = reprec.getcalls("pytest_collection_modifyitems")
+        matchers = [MarkMatcher.from_item(item) for item in modifyitems_call.items]
+        assert len(matchers) == 2
+
+        def selected(markexpr):
+            expression = Expression.compile(markexpr)
+            return sum(expression.evaluate(matcher) for matcher in matchers)
+
+        assert selected("scenario_tag_10 and not scenario_tag_01") == 1
+        assert selected("scenario_tag_01 and not scenario_tag_10") == 1
+        assert selected("feature_tag_1") == 2
+        assert selected("feature_tag_10") == 0
+    else:
+        # No expression engine on pytest 5; fall back to one session per expression
+        for markexpr, passed, deselected in [
+            ("scenario_tag_10 and not scenario_tag_01", 1, 1),
+            ("scenario_tag_01 and not scenario_tag_10", 1, 1),
+            ("feature_tag_10", 0, 2),
+        ]:
+            outcomes = testdir.runpytest("-m", markexpr, "-vv", "-p", "no:cacheprovider").parseoutcomes()
+            assert outcomes.get("passed", 0) == passed
+            assert outcomes.get("deselected", 0) == deselected
 
 
 @mark.surplus
@@ -379,47 +441,11 @@ def test_tags_selector_with_inlined_tags_examples(testdir):
 @mark.parametrize("parser,", [param("Parser", marks=[mark.deprecated]), "GherkinParser"])
 def test_tags_after_background_issue_160(testdir, parser):
     """Make sure using a tag after background works."""
-    testdir.makefile(
-        ".ini",
-        pytest="""\
-            [pytest]
-            markers = tag
-            """,
-    )
-    testdir.makefile(
-        ".feature",
-        test="""\
-            Feature: Tags after background
-
-                Background:
-                    Given I have a bar
-
-                @tag
-                Scenario: Tags
-                    Given I have a baz
-
-                Scenario: Tags 2
-                    Given I have a baz
-            """,
-    )
-    testdir.makepyfile(
-        f"""\
-        import pytest
-        from pytest_bdd import given, scenarios
-        from pytest_bdd.parser import {parser} as Parser
-
-        @given('I have a bar')
-        def i_have_bar():
-            return 'bar'
-
-        @given('I have a baz')
-        def i_have_baz():
-            return 'baz'
-
-        scenarios('test.feature', parser=Parser())
-        """
-    )
-    result = testdir.runpytest("-m", "tag", "-vv").parseoutcomes()
+    testdir.makefile(".ini", pytest=TAGS_AFTER_BACKGROUND_INI)
+    testdir.makefile(".feature", test=TAGS_AFTER_BACKGROUND_FEATURE)
+    testdir.makeconftest(TAGS_STEPS_CONFTEST)
+    testdir.makepyfile(TAGS_SCENARIOS_PY_TEMPLATE.format(parser=parser))
+    result = testdir.runpytest("-m", "tag", "-vv", "-p", "no:cacheprovider").parseoutcomes()
     assert result["passed"] == 1
     assert result["deselected"] == 1
 
@@ -467,8 +493,8 @@ def test_tag_with_spaces(testdir):
         scenarios('test.feature', parser=Parser())
         """
     )
-    result = testdir.runpytest_subprocess()
-    result.stdout.fnmatch_lines(["*= 1 passed * =*"])
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
 
 
 @mark.parametrize("parser,", [param("Parser", marks=[mark.deprecated]), "GherkinParser"])
@@ -502,53 +528,31 @@ def test_at_in_scenario(testdir, parser):
     """
     )
 
-    # Deprecate --strict after pytest 6.1
-    # https://docs.org/en/stable/deprecations.html#the-strict-command-line-option
-    strict_option = "--strict-markers" if compare_distribution_version("pytest", "6.2", ge) else "--strict"
+    result = testdir.runpytest(STRICT_OPTION)
+    result.assert_outcomes(passed=2)
 
-    result = testdir.runpytest_subprocess(strict_option)
-    result.stdout.fnmatch_lines(["*= 2 passed * =*"])
+
+GET_TAGS_CASES = [
+    ("@foo @bar", {"foo", "bar"}),
+    ("@with spaces @bar", {"with spaces", "bar"}),
+    ("@double @double", {"double"}),
+    ("    @indented", {"indented"}),
+    (None, set()),
+    ("foobar", set()),
+    ("", set()),
+]
 
 
 @mark.deprecated
-@mark.parametrize(
-    "line, expected",
-    [
-        ("@foo @bar", {"foo", "bar"}),
-        ("@with spaces @bar", {"with spaces", "bar"}),
-        ("@double @double", {"double"}),
-        ("    @indented", {"indented"}),
-        (None, set()),
-        ("foobar", set()),
-        ("", set()),
-    ],
-)
-def test_get_tags(line, expected):
-    assert Parser.get_tags(line) == expected
+def test_get_tags():
+    for line, expected in GET_TAGS_CASES:
+        assert Parser.get_tags(line) == expected, line
 
 
 @mark.parametrize("parser,", [param("Parser", marks=[mark.deprecated]), "GherkinParser"])
 def test_invalid_tags(testdir, parser):
     features = testdir.mkdir("features")
-    features.join("test.feature").write_text(
-        """\
-        Feature: Invalid tags
-            Scenario: Invalid tags
-                @tag
-                Given foo
-                When bar
-                Then baz
-        """,
-        "utf-8",
-        ensure=True,
-    )
-    testdir.makepyfile(
-        f"""\
-        from pytest_bdd import scenarios
-        from pytest_bdd.parser import {parser} as Parser
-
-        scenarios('features', parser=Parser())
-        """
-    )
+    features.join("test.feature").write_text(INVALID_TAGS_FEATURE, "utf-8", ensure=True)
+    testdir.makepyfile(INVALID_TAGS_PY_TEMPLATE.format(parser=parser))
     result = testdir.runpytest()
     result.stdout.fnmatch_lines(["*FeatureError*"])
@@ -10,6 +10,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
 PYTEST_6 = compare_distribution_version("pytest", "6", ge)
 
+# Deprecate --strict after pytest 6.1
+# https://docs.org/en/stable/deprecations.html#the-strict-command-line-option
+STRICT_OPTION = "--strict-markers" if compare_distribution_version("pytest", "6.2", ge) else "--strict"
+
 
 if PYTEST_6:
 